@@ -1,34 +1,89 @@
 from __future__ import annotations
 
 import argparse
+from collections.abc import Container, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-import hashlib
 import json
 import logging
+import mmap
 import os
 from pathlib import Path
 import stat
 import time
 
 from kaggle.api.kaggle_api_extended import KaggleApi
+import orjson
+import xxhash
 
 LOGGER = logging.getLogger(__name__)
 DEFAULT_OUT_DIR = Path("data/raw")
+# Files at least this large are hashed through a memory map instead of a read loop
+MMAP_MIN_BYTES = 64 * 1024 * 1024
 
 
-def _sha256(path: Path) -> str:
-    """Compute a file's SHA-256 checksum in streaming mode."""
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
+def _xxh64(path: Path) -> str:
+    """
+    Compute a file's xxHash64 digest, memory-mapping large files and streaming the rest.
+
+    The manifest is an integrity check, not a security boundary, so a fast
+    non-cryptographic hash is sufficient here.
+    """
+    with path.open("rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+            # hash the whole mapping in one call; the kernel handles readahead
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return xxhash.xxh64(mm).hexdigest()
+        if hasattr(os, "posix_fadvise"):  # let the kernel read ahead on cold cache
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        # read into one reusable buffer instead of allocating a bytes object per chunk
+        h = xxhash.xxh64()
+        buf = bytearray(4 * 1024 * 1024)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            h.update(view[:n])
     return h.hexdigest()
 
 
+def _iter_files(root: Path, exclude: Container[str] = ()) -> Iterator[os.DirEntry[str]]:
+    """Recursively yield file entries under `root`, skipping names in `exclude`."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file() and entry.name not in exclude:
+                    yield entry
+
+
+def _file_meta(entry: os.DirEntry[str], hash_cache: dict | None = None) -> dict:
+    """
+    Build the manifest entry for a single file (stat is cached on the DirEntry).
+
+    The digest is reused from `hash_cache` when the file's size and mtime are unchanged.
+    """
+    st = entry.stat()
+    cached = (hash_cache or {}).get(entry.path)
+    digest = None
+    # malformed entries are treated as misses
+    if (
+        isinstance(cached, dict)
+        and cached.get("size") == st.st_size
+        and cached.get("mtime_ns") == st.st_mtime_ns
+    ):
+        digest = cached.get("xxh64")
+    if not isinstance(digest, str):
+        digest = _xxh64(Path(entry.path))
+    return {"path": entry.path, "size": st.st_size, "xxh64": digest}
+
+
 def _write_json_atomic(path: Path, payload: dict) -> None:
     """Write JSON atomically to avoid partial files in concurrent scenarios."""
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(payload, indent=2))
+    tmp.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
     tmp.replace(path)
 
 
@@ -82,6 +137,7 @@ class KaggleDatasetIngestor:
 
         self.out_dir.mkdir(parents=True, exist_ok=True)
         self.manifest_path = self.out_dir / "manifest.json"
+        self.hash_cache_path = self.out_dir / ".hash_cache.json"
 
     # ------------------- Public API ------------------------
 
@@ -120,7 +176,15 @@ class KaggleDatasetIngestor:
         return any(Path(f["path"]).exists() for f in manifest.get("files", []))
 
     def _read_manifest(self) -> dict:
-        return json.loads(self.manifest_path.read_text())
+        return orjson.loads(self.manifest_path.read_bytes())
+
+    def _read_hash_cache(self) -> dict:
+        """Load cached digests keyed by path; a missing or unreadable cache is treated as empty."""
+        try:
+            cache = orjson.loads(self.hash_cache_path.read_bytes())
+        except Exception:
+            return {}
+        return cache if isinstance(cache, dict) else {}
 
     def _authenticate_and_download(self) -> None:
         """
@@ -165,15 +229,28 @@ class KaggleDatasetIngestor:
                     pass
 
     def _build_manifest(self) -> dict:
-        files: list[Path] = [
-            p for p in self.out_dir.rglob("*") if p.is_file() and p.name != self.manifest_path.name
-        ]
-        file_meta = [
-            {"path": str(p), "size": p.stat().st_size, "sha256": _sha256(p)} for p in files
-        ]
+        hash_cache = self._read_hash_cache()
+        exclude = {self.manifest_path.name, self.hash_cache_path.name}
+        files = sorted(_iter_files(self.out_dir, exclude=exclude), key=lambda e: e.path)
+        # hashing releases the GIL, so threads overlap I/O and digest work across files
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as ex:
+            file_meta = list(ex.map(lambda e: _file_meta(e, hash_cache), files))
+        _write_json_atomic(
+            self.hash_cache_path,
+            {
+                m["path"]: {
+                    "size": m["size"],
+                    "mtime_ns": e.stat().st_mtime_ns,
+                    "xxh64": m["xxh64"],
+                }
+                for e, m in zip(files, file_meta, strict=True)
+            },
+        )
+        now = time.time()
         return {
             "dataset": self.dataset_slug,
-            "downloaded_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "downloaded_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+            "downloaded_at_epoch": int(now),
             "unzip": self.unzip,
             "files": file_meta,
         }
@@ -0,0 +1,73 @@
+import csv
+import importlib.util
+from pathlib import Path
+
+from pandera.errors import SchemaErrors
+import pytest
+
+_SPEC = importlib.util.spec_from_file_location(
+    "data_checks", Path(__file__).resolve().parents[1] / "scripts" / "data_checks.py"
+)
+data_checks = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(data_checks)
+
+_VALID_ROW = {
+    "customer_id": "fffe0001",
+    "Name": "Jane Doe",
+    "age": "30",
+    "gender": "F",
+    "security_no": "XW0DQ7H",
+    "region_category": "Town",
+    "membership_category": "Gold Membership",
+    "joining_date": "2017-08-17",
+    "joined_through_referral": "No",
+    "referral_id": "xxxxxxxx",
+    "preferred_offer_types": "Gift Vouchers/Coupons",
+    "medium_of_operation": "Desktop",
+    "internet_option": "Wi-Fi",
+    "last_visit_time": "16:08:02",
+    "days_since_last_login": "17",
+    "avg_time_spent": "300.63",
+    "avg_transaction_value": "53005.25",
+    "avg_frequency_login_days": "17.0",
+    "points_in_wallet": "781.75",
+    "used_special_discount": "Yes",
+    "offer_application_preference": "Yes",
+    "past_complaint": "No",
+    "complaint_status": "Not Applicable",
+    "feedback": "Products always in Stock",
+    "churn_risk_score": "2",
+}
+
+
+def _write_csv(path: Path, churn_scores: list[str]) -> Path:
+    with path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(_VALID_ROW))
+        writer.writeheader()
+        for i, score in enumerate(churn_scores):
+            writer.writerow(
+                {**_VALID_ROW, "customer_id": f"fffe{i:04d}", "churn_risk_score": score}
+            )
+    return path
+
+
+def test_fractional_churn_score_is_reported_without_masked_rows(tmp_path):
+    csv_path = _write_csv(tmp_path / "train.csv", ["1", "-1", "3.5", "-1", "2"])
+    df = data_checks._load_and_clean_data(str(csv_path))
+
+    with pytest.raises(SchemaErrors) as excinfo:
+        data_checks.SCHEMA.validate(df, lazy=True)
+
+    failures = excinfo.value.failure_cases
+    assert set(failures["column"]) == {"churn_risk_score"}
+    assert failures["index"].tolist() == [2]
+    assert failures["failure_case"].tolist() == [3.5]
+
+
+def test_valid_churn_scores_pass_with_masked_rows(tmp_path):
+    csv_path = _write_csv(tmp_path / "train.csv", ["1", "-1", "5", "0"])
+    df = data_checks._load_and_clean_data(str(csv_path))
+
+    data_checks.SCHEMA.validate(df, lazy=True, inplace=True)
+
+    assert df["churn_risk_score"].astype("Int8").isna().tolist() == [False, True, False, False]
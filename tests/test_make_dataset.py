@@ -0,0 +1,127 @@
+import os
+from pathlib import Path
+
+import orjson
+import pytest
+
+from customer_churn_prediction.data import make_dataset
+from customer_churn_prediction.data.make_dataset import KaggleDatasetIngestor, _iter_files
+
+
+def _write(path: Path, content: bytes = b"x") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def test_iter_files_walks_nested_dirs_and_skips_excluded(tmp_path):
+    _write(tmp_path / "b.csv")
+    _write(tmp_path / "a" / "c.csv")
+    _write(tmp_path / "a" / "deeper" / "d.csv")
+    _write(tmp_path / "manifest.json")
+    _write(tmp_path / "a" / "manifest.json")
+
+    found = sorted(e.path for e in _iter_files(tmp_path, exclude={"manifest.json"}))
+
+    assert found == sorted(str(tmp_path / p) for p in ("b.csv", "a/c.csv", "a/deeper/d.csv"))
+
+
+def test_iter_files_includes_symlinked_files(tmp_path):
+    target = _write(tmp_path / "real" / "data.csv")
+    (tmp_path / "link.csv").symlink_to(target)
+
+    found = {e.path for e in _iter_files(tmp_path)}
+
+    assert str(tmp_path / "link.csv") in found
+    assert str(target) in found
+
+
+@pytest.fixture
+def ingestor(tmp_path):
+    _write(tmp_path / "train.csv", b"a,b\n1,2\n")
+    _write(tmp_path / "sub" / "test.csv", b"a,b\n3,4\n")
+    return KaggleDatasetIngestor("owner/dataset", out_dir=tmp_path)
+
+
+@pytest.fixture
+def hash_calls(monkeypatch):
+    calls: list[Path] = []
+    real = make_dataset._xxh64
+
+    def counting(path: Path) -> str:
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(make_dataset, "_xxh64", counting)
+    return calls
+
+
+def test_build_manifest_lists_files_in_sorted_order(tmp_path):
+    for name in ("z.csv", "m.csv", "b/y.csv", "a.csv", "b/a/x.csv", "c/k.csv", "b/z.csv"):
+        _write(tmp_path / name)
+
+    manifest = KaggleDatasetIngestor("owner/dataset", out_dir=tmp_path)._build_manifest()
+
+    paths = [f["path"] for f in manifest["files"]]
+    assert len(paths) == 7
+    assert paths == sorted(paths)
+
+
+def test_hash_cache_hit_skips_rehash(ingestor, hash_calls):
+    first = ingestor._build_manifest()
+    assert len(hash_calls) == 2
+    assert ingestor.hash_cache_path.exists()
+
+    second = ingestor._build_manifest()
+
+    assert len(hash_calls) == 2
+    assert second["files"] == first["files"]
+    assert all(f["path"] != str(ingestor.hash_cache_path) for f in second["files"])
+
+
+def test_hash_cache_misses_on_size_or_mtime_change(ingestor, hash_calls):
+    ingestor._build_manifest()
+    train = ingestor.out_dir / "train.csv"
+    test = ingestor.out_dir / "sub" / "test.csv"
+
+    train.write_bytes(b"a,b\n1,2\n5,6\n")
+    st = test.stat()
+    os.utime(test, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    hash_calls.clear()
+
+    manifest = ingestor._build_manifest()
+
+    assert sorted(hash_calls) == sorted([train, test])
+    entry = next(f for f in manifest["files"] if f["path"] == str(train))
+    assert entry["xxh64"] == make_dataset.xxhash.xxh64(train.read_bytes()).hexdigest()
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"not json",
+        orjson.dumps([1, 2]),
+        orjson.dumps({"anything": "not-a-dict-entry"}),
+    ],
+)
+def test_corrupt_hash_cache_is_ignored(ingestor, hash_calls, payload):
+    ingestor.hash_cache_path.write_bytes(payload)
+
+    manifest = ingestor._build_manifest()
+
+    assert len(hash_calls) == 2
+    assert len(manifest["files"]) == 2
+    assert isinstance(orjson.loads(ingestor.hash_cache_path.read_bytes()), dict)
+
+
+def test_malformed_cache_entry_is_a_miss(ingestor, hash_calls):
+    ingestor._build_manifest()
+    cache = orjson.loads(ingestor.hash_cache_path.read_bytes())
+    for entry in cache.values():
+        del entry["mtime_ns"]
+    ingestor.hash_cache_path.write_bytes(orjson.dumps(cache))
+    hash_calls.clear()
+
+    ingestor._build_manifest()
+
+    assert len(hash_calls) == 2